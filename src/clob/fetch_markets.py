@@ -1,51 +1,42 @@
 """
-Fetch all markets from Polymarket and save to JSON files.
+Fetch all markets from Polymarket and save to JSONL/JSON files.
 
 This script fetches all markets using py_clob_client and saves:
-1. Full market data to markets.json
+1. Full market data to markets.jsonl (one market per line) plus a
+   markets.meta.json sidecar with the run metadata
 2. Market names/questions to market_names.json
 """
 import argparse
-import json
+import asyncio
 import sys
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
+import aiohttp
+import orjson
 from py_clob_client.client import ClobClient
 
 
 DEFAULT_API_URL = "https://clob.polymarket.com"
 DEFAULT_GAMMA_API_URL = "https://gamma-api.polymarket.com"
 DEFAULT_CHAIN_ID = 137
-DEFAULT_OUTPUT_FILENAME = "markets.json"
+DEFAULT_OUTPUT_FILENAME = "markets.jsonl"
 DEFAULT_NAMES_OUTPUT_FILENAME = "market_names.json"
-DEFAULT_CURRENT_MARKETS_FILENAME = "current_markets.json"
+DEFAULT_CURRENT_MARKETS_FILENAME = "current_markets.jsonl"
 DEFAULT_CURRENT_NAMES_FILENAME = "current_market_names.json"
 MAX_PAGES = 100  # Safety limit to prevent infinite loops
 
 
-def fetch_markets_with_filter(
-	next_cursor: Optional[str] = None,
-	mode: Optional[str] = None,
-	limit: int = 500,
-	offset: Optional[int] = None
-) -> Dict[str, Any]:
+GAMMA_CONCURRENCY = 32  # Max in-flight Gamma API requests
+MAX_RETRIES = 5  # Retries per page on 429/transient errors
+CLOB_END_CURSOR = "LTE="  # Terminal cursor the CLOB API returns on the last page
+
+
+def _mode_params(mode: Optional[str], limit: int) -> Dict[str, str]:
 	"""
-	Fetch markets from Gamma API with optional filtering parameters.
-	
-	The Gamma API supports server-side filtering, unlike the CLOB API.
-	
-	Args:
-		next_cursor: Pagination cursor (None for first page)
-		mode: Filter mode - "open", "active", "closed", or "all" (None = all)
-		limit: Number of markets per page (default 500)
-		offset: Offset for fallback pagination when cursor not available
-	
-	Returns:
-		Response dictionary with 'data' and 'next_cursor' keys
-	
+	Build Gamma API query params for a filter mode.
+
 	Modes:
 		- "open": active=true AND closed=false (markets currently trading)
 		- "active": active=true (all active markets, may include closed)
@@ -53,8 +44,7 @@ def fetch_markets_with_filter(
 		- "all": no filters (everything)
 	"""
 	params = {"limit": str(limit)}
-	
-	# Apply mode-based filtering
+
 	if mode == "open":
 		params["closed"] = "false"
 		params["active"] = "true"
@@ -63,38 +53,130 @@ def fetch_markets_with_filter(
 	elif mode == "closed":
 		params["closed"] = "true"
 	# mode == "all" or None => no filters
-	
-	if next_cursor:
-		params["cursor"] = next_cursor
-	
+
+	return params
+
+
+async def fetch_page(
+	session: aiohttp.ClientSession,
+	semaphore: asyncio.Semaphore,
+	limit: int,
+	mode: Optional[str] = None,
+	offset: Optional[int] = None,
+	cursor: Optional[str] = None
+) -> tuple:
+	"""
+	Fetch one page of markets from the Gamma API.
+
+	Retries with exponential backoff on 429 (rate limit) and transient
+	errors. Concurrency is bounded by the shared semaphore.
+
+	Args:
+		session: Shared aiohttp session (pooled connections)
+		semaphore: Concurrency limiter shared across all pages
+		limit: Number of markets per page
+		mode: Filter mode - "open", "active", "closed", or "all"
+		offset: Pagination offset (offset mode)
+		cursor: Pagination cursor (cursor mode)
+
+	Returns:
+		Tuple of (markets, next_cursor); markets is empty past the last
+		page and next_cursor is None unless the server paginates by cursor
+	"""
+	params = _mode_params(mode, limit)
 	if offset is not None:
 		params["offset"] = str(offset)
-	
+	if cursor is not None:
+		params["cursor"] = cursor
 	endpoint = f"{DEFAULT_GAMMA_API_URL}/markets"
-	response = requests.get(endpoint, params=params, timeout=30)
-	response.raise_for_status()
-	
-	data = response.json()
-	
-	# Gamma API returns data differently depending on structure
-	if isinstance(data, dict):
-		return {
-			"data": data.get("data", []),
-			"next_cursor": data.get("next_cursor"),
-			"count": len(data.get("data", []))
-		}
-	elif isinstance(data, list):
-		return {
-			"data": data,
-			"next_cursor": None,
-			"count": len(data)
-		}
-	else:
-		return {
-			"data": [],
-			"next_cursor": None,
-			"count": 0
-		}
+
+	backoff = 1.0
+	for attempt in range(MAX_RETRIES):
+		async with semaphore:
+			try:
+				async with session.get(endpoint, params=params) as response:
+					if response.status == 429:
+						# Honor Retry-After if the server provides it
+						retry_after = response.headers.get("Retry-After")
+						delay = float(retry_after) if retry_after else backoff
+						await asyncio.sleep(delay)
+						backoff *= 2
+						continue
+					response.raise_for_status()
+					data = await response.json()
+			except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+				if attempt == MAX_RETRIES - 1:
+					print(f"Error fetching page (offset={offset}, cursor={cursor}): {e}", file=sys.stderr)
+					return [], None
+				await asyncio.sleep(backoff)
+				backoff *= 2
+				continue
+
+		# Gamma API returns either a bare list or a dict with 'data'
+		if isinstance(data, dict):
+			return data.get("data", []), data.get("next_cursor")
+		elif isinstance(data, list):
+			return data, None
+		return [], None
+
+	return [], None
+
+
+async def fetch_gamma_markets(
+	mode: Optional[str],
+	limit: int,
+	max_pages: int
+) -> List[Dict[str, Any]]:
+	"""
+	Fetch all Gamma API pages, deciding the pagination style once.
+
+	The first page acts as a probe: if the server returns a next_cursor,
+	the remaining pages are walked cursor-by-cursor (cursors cannot be
+	prefetched); otherwise all offsets fan out concurrently behind the
+	semaphore so page latency is paid once instead of once per page.
+
+	Args:
+		mode: Filter mode - "open", "active", "closed", or "all"
+		limit: Number of markets per page
+		max_pages: Maximum number of pages to fetch (safety limit)
+
+	Returns:
+		List of raw market dictionaries across all pages
+	"""
+	semaphore = asyncio.Semaphore(GAMMA_CONCURRENCY)
+	connector = aiohttp.TCPConnector(limit_per_host=64)
+	timeout = aiohttp.ClientTimeout(total=30)
+
+	async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+		# Probe the first page to learn which pagination style applies
+		all_markets, next_cursor = await fetch_page(session, semaphore, limit, mode, offset=0)
+		if len(all_markets) < limit:
+			return all_markets
+
+		if next_cursor:
+			# Cursor pagination: strictly sequential
+			page_count = 1
+			while next_cursor and page_count < max_pages:
+				page, next_cursor = await fetch_page(
+					session, semaphore, limit, mode, cursor=next_cursor
+				)
+				if not page:
+					break
+				all_markets.extend(page)
+				page_count += 1
+			return all_markets
+
+		# Offset pagination: fan out the remaining offsets concurrently
+		pages = await asyncio.gather(*[
+			fetch_page(session, semaphore, limit, mode, offset=offset)
+			for offset in range(limit, max_pages * limit, limit)
+		])
+
+	for page, _ in pages:
+		if not page:
+			break
+		all_markets.extend(page)
+	return all_markets
 
 
 def extract_market_data(market: Dict[str, Any]) -> Dict[str, Any]:
@@ -139,189 +221,200 @@ def fetch_all_markets(
 ) -> List[Dict[str, Any]]:
 	"""
 	Fetch all Polymarket markets with pagination.
-	
+
 	Args:
 		api_url: Polymarket CLOB API base URL (used when mode is None)
 		chain_id: Blockchain chain ID (137 for Polygon)
 		max_pages: Maximum number of pages to fetch (safety limit)
 		mode: Filter mode - "open", "active", "closed", or "all" (None = use CLOB API)
 		limit: Number of markets per page (default 500)
-	
+
 	Returns:
 		List of market dictionaries
-	
-	Modes:
-		- "open": active=true AND closed=false (markets currently trading)
-		- "active": active=true (all active markets)
-		- "closed": closed=true (resolved markets)
-		- "all": no filters via Gamma API (everything)
-		- None: use CLOB API (full details, no filtering)
-	
+
 	Note:
-		When mode is specified, the Gamma API is used which supports filtering.
-		When mode is None, the CLOB API is used which returns full market details.
+		When mode is specified, all Gamma API pages are fetched concurrently
+		with aiohttp (offset pagination), so total time is roughly one page
+		latency plus O(pages / concurrency) instead of one latency per page.
+		When mode is None, the CLOB API is paged serially by cursor since
+		cursors cannot be fetched ahead of time.
 	"""
-	all_markets = []
-	cursor: Optional[str] = None if mode else "MA=="
-	offset: Optional[int] = None
-	page_count = 0
-	total_fetched = 0
-	
 	mode_text = f" (mode={mode})" if mode else ""
 	print(f"Fetching markets{mode_text}...", file=sys.stderr)
-	
+
+	if mode:
+		# Concurrent Gamma API fetch
+		markets_raw = asyncio.run(fetch_gamma_markets(mode, limit, max_pages))
+		all_markets = [extract_market_data(m) for m in markets_raw]
+		print(f"✓ Fetched {len(all_markets)} total markets", file=sys.stderr)
+		return all_markets
+
+	# CLOB API path: serial cursor pagination. One client for the whole
+	# run so the underlying HTTP session/TLS handshake is reused per page.
+	all_markets = []
+	client = ClobClient(api_url, chain_id=chain_id)
+	cursor: Optional[str] = "MA=="
+	page_count = 0
+
 	while page_count < max_pages:
 		try:
-			# Use Gamma API with filtering when mode is specified
-			if mode:
-				response = fetch_markets_with_filter(
-					next_cursor=cursor,
-					mode=mode,
-					limit=limit,
-					offset=offset
-				)
-			else:
-				# Use CLOB client for unfiltered requests
-				client = ClobClient(api_url, chain_id=chain_id)
-				response = client.get_markets(next_cursor=cursor)
-				# Normalize response format
-				if isinstance(response, dict) and "data" in response:
-					response["count"] = len(response["data"])
-			
-			# Extract data from response
-			if isinstance(response, dict) and "data" in response:
-				markets_raw = response["data"]
-				count = len(markets_raw)
-				total_fetched += count
-				
-				# Process markets
-				for m in markets_raw:
-					# Extract comprehensive market data
-					market = extract_market_data(m)
-					all_markets.append(market)
-				
-				# Get next cursor
-				next_cursor = response.get("next_cursor")
-				
-				page_count += 1
-				print(f"  Batch {page_count}: +{count} fetched (total: {len(all_markets)}), next_cursor={next_cursor}, offset={offset}", file=sys.stderr)
-				
-				# Stop if no more pages
-				if not next_cursor or (cursor and next_cursor == cursor):
-					# Check if we should try offset pagination
-					if mode and count == limit:
-						# Fallback to offset paging when full batch but no cursor
-						cursor = None
-						offset = limit if offset is None else offset + limit
-					else:
-						break
-				else:
-					# Use cursor for next page
-					cursor = next_cursor
-					offset = None
-				
-				# Stop if we got fewer results than expected (likely last page)
-				if count < limit:
-					break
-				
-				# Add respectful delay between requests
-				time.sleep(0.25)
-			else:
+			response = client.get_markets(next_cursor=cursor)
+
+			if not (isinstance(response, dict) and "data" in response):
 				# Unexpected response format
 				break
-				
+
+			markets_raw = response["data"]
+
+			for m in markets_raw:
+				all_markets.append(extract_market_data(m))
+
+			next_cursor = response.get("next_cursor")
+			page_count += 1
+
+			# The terminal cursor arrives on the last data page; stopping
+			# here avoids issuing one extra request just to see it echoed
+			if not next_cursor or next_cursor == cursor or next_cursor == CLOB_END_CURSOR:
+				break
+			cursor = next_cursor
+
+			# Add respectful delay between requests
+			time.sleep(0.25)
+
 		except Exception as e:
 			print(f"Error on batch {page_count + 1}: {e}", file=sys.stderr)
 			break
-	
+
 	print(f"✓ Fetched {len(all_markets)} total markets in {page_count} batches", file=sys.stderr)
 	return all_markets
 
 
-def filter_current_markets(markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# Name fields in order of preference, built once instead of per market
+NAME_FIELDS = ("question", "title", "name", "description", "market_slug")
+
+
+def summarize_markets(markets: List[Dict[str, Any]]) -> tuple:
 	"""
-	Filter for only current/active markets that are still open for trading.
-	
-	A market is considered "current" if:
-	- active == True (market is actively trading)
-	- closed == False (market hasn't been resolved yet)
-	
+	Walk the market list once, producing the derived views together.
+
+	Replaces separate passes for filtering, name extraction, and asset-id
+	counting with a single loop over the (potentially very large) list.
+
 	Args:
 		markets: List of market dictionaries
-	
+
 	Returns:
-		List of current/open market dictionaries
+		Tuple of (current_markets, names, asset_id_count) where
+		current_markets are the active-and-not-closed markets and names
+		and the token count cover every market
 	"""
 	current = []
-	
+	names = []
+	asset_id_count = 0
+
 	for market in markets:
 		if not isinstance(market, dict):
 			continue
-		
+
 		# A market is "current" if it's active and not closed
-		is_active = market.get("active", False)  # Default to inactive if missing
-		is_closed = market.get("closed", True)  # Default to closed if missing
-		
-		# Market is current if it's active and not closed
-		if is_active and not is_closed:
+		if market.get("active", False) and not market.get("closed", True):
 			current.append(market)
-	
-	return current
+
+		# First non-empty name field wins
+		for field in NAME_FIELDS:
+			value = market.get(field)
+			if isinstance(value, str) and value.strip():
+				names.append(value.strip())
+				break
+
+		for token in market.get("tokens", []):
+			if token.get("token_id"):
+				asset_id_count += 1
+
+	return current, names, asset_id_count
+
+
+def filter_current_markets(markets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+	"""
+	Filter for only current/active markets that are still open for trading.
+
+	A market is considered "current" if:
+	- active == True (market is actively trading)
+	- closed == False (market hasn't been resolved yet)
+
+	Args:
+		markets: List of market dictionaries
+
+	Returns:
+		List of current/open market dictionaries
+	"""
+	return summarize_markets(markets)[0]
 
 
 def extract_market_names(markets: List[Dict[str, Any]]) -> List[str]:
 	"""
 	Extract market names/questions from market data.
-	
+
 	Args:
 		markets: List of market dictionaries
-	
+
 	Returns:
 		List of market names
 	"""
-	names = []
-	
-	for market in markets:
-		if not isinstance(market, dict):
-			continue
-		
-		# Try different name fields in order of preference
-		name = None
-		for field in ["question", "title", "name", "description", "market_slug"]:
-			value = market.get(field)
-			if isinstance(value, str) and value.strip():
-				name = value.strip()
-				break
-		
-		if name:
-			names.append(name)
-	
-	return names
+	return summarize_markets(markets)[1]
 
 
 def save_json(data: Any, filepath: Path, indent: int = 2) -> None:
 	"""
-	Save data to JSON file.
+	Save data to JSON file using orjson (much faster than stdlib json).
 	
 	Args:
 		data: Data to save
 		filepath: Output file path
-		indent: JSON indentation
+		indent: JSON indentation (>0 pretty-prints with 2 spaces, 0 for compact)
+	"""
+	option = orjson.OPT_NON_STR_KEYS
+	if indent > 0:
+		option |= orjson.OPT_INDENT_2
+	filepath.parent.mkdir(parents=True, exist_ok=True)
+	filepath.write_bytes(orjson.dumps(data, option=option))
+
+
+def save_jsonl(records: List[Dict[str, Any]], filepath: Path) -> None:
+	"""
+	Save records to a JSONL file, one record per line.
+
+	Streams records incrementally instead of serializing the whole list
+	into one indented blob, so peak memory stays flat and downstream
+	tools can read line-by-line.
+
+	Args:
+		records: Records to save
+		filepath: Output file path
 	"""
 	filepath.parent.mkdir(parents=True, exist_ok=True)
-	with filepath.open("w", encoding="utf-8") as f:
-		json.dump(data, f, ensure_ascii=False, indent=indent)
+	with filepath.open("wb") as f:
+		for record in records:
+			# OPT_APPEND_NEWLINE bakes the terminator into the serialized
+			# buffer, so each record is one write instead of two
+			f.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
 
 
-def create_market_metadata(markets: List[Dict[str, Any]], only_open: bool = False, total_original: int = None) -> Dict[str, Any]:
+def create_market_metadata(
+	markets: List[Dict[str, Any]],
+	asset_id_count: int,
+	only_open: bool = False,
+	total_original: int = None
+) -> Dict[str, Any]:
 	"""
 	Create metadata wrapper for market data.
-	
+
 	Args:
 		markets: List of market dictionaries
+		asset_id_count: Total token ids, as counted by summarize_markets
 		only_open: Whether this is filtered to only open markets
 		total_original: Total number of markets before filtering (if filtered)
-	
+
 	Returns:
 		Dictionary with metadata and markets
 	"""
@@ -330,21 +423,13 @@ def create_market_metadata(markets: List[Dict[str, Any]], only_open: bool = Fals
 		"only_open_markets": only_open,
 		"total_markets": len(markets),
 	}
-	
+
 	if only_open and total_original is not None:
 		metadata["total_original_markets"] = total_original
-	
-	# Extract all asset IDs
-	asset_ids = []
-	for market in markets:
-		for token in market.get("tokens", []):
-			token_id = token.get("token_id")
-			if token_id:
-				asset_ids.append(token_id)
-	
-	metadata["total_asset_ids"] = len(asset_ids)
+
+	metadata["total_asset_ids"] = asset_id_count
 	metadata["markets"] = markets
-	
+
 	return metadata
 
 
@@ -454,17 +539,23 @@ def main() -> int:
 			output_markets_path = markets_path
 			output_names_path = names_path
 		
+		# One pass over the fetched markets for names and asset-id count
+		_, names, asset_id_count = summarize_markets(all_markets)
+
 		# Create metadata wrapper
-		market_data = create_market_metadata(all_markets, only_open=(mode == "open"))
+		market_data = create_market_metadata(all_markets, asset_id_count, only_open=(mode == "open"))
 		market_data["mode"] = mode if mode else "clob_api"
 		
-		# Save markets with metadata
-		save_json(market_data, output_markets_path, indent=args.indent)
+		# Save bulk markets as JSONL with a small sidecar metadata file
+		markets = market_data.pop("markets")
+		save_jsonl(markets, output_markets_path)
+		meta_path = output_markets_path.with_suffix(".meta.json")
+		save_json(market_data, meta_path, indent=args.indent)
 		print(f"✓ Saved {len(all_markets)} {mode_name} markets to {output_markets_path}")
+		print(f"  - Metadata: {meta_path}")
 		print(f"  - Total asset IDs: {market_data['total_asset_ids']}")
 		
-		# Extract and save market names
-		names = extract_market_names(all_markets)
+		# Save market names collected in the summary pass above
 		save_json(names, output_names_path, indent=args.indent)
 		print(f"✓ Saved {len(names)} {mode_name} market names to {output_names_path}")
 		
@@ -13,16 +13,70 @@ Normalization includes:
 - Category tagging
 """
 
-import json
+import mmap
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+import orjson
+from tqdm import tqdm
+
+try:
+    # Optional accelerator: RE2 is a DFA engine with guaranteed linear-time
+    # matching, noticeably faster on the alternation-heavy patterns below
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+# Bound on the clean/expand memo caches; markets in the same event often
+# share identical boilerplate descriptions, so hits skip the whole pipeline
+_TEXT_CACHE_SIZE = 4096
+
+
+def _compile_fast(pattern: str, flags: int = 0):
+    """Compile with RE2 when available, falling back to stdlib re.
+
+    RE2 rejects some constructs (e.g. lookaheads), so any pattern it cannot
+    handle silently compiles with the stdlib engine instead.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
 
 class MarketNormalizer:
     """Normalizes and enriches market data for semantic search"""
-    
+
+    __slots__ = (
+        'abbreviations',
+        '_abbr_pattern',
+        '_abbr_lookup',
+        '_ws_pattern',
+        '_url_pattern',
+        '_special_char_pattern',
+        '_quote_table',
+        'ticker_pattern',
+        'price_pattern',
+        'date_pattern',
+        'comparator_pattern',
+        '_entities_pattern',
+        '_category_keywords',
+        '_category_by_keyword',
+        '_category_pattern',
+        'boilerplate_phrases',
+        '_boilerplate_pattern',
+        '_resolution_split_pattern',
+        '_clean_cache',
+        '_expand_cache',
+    )
+
     def __init__(self):
         # Common abbreviations in crypto/politics/sports
         self.abbreviations = {
@@ -46,7 +100,6 @@ class MarketNormalizer:
             'NBA': 'National Basketball Association',
             'NFL': 'National Football League',
             'MLB': 'Major League Baseball',
-            'GDP': 'Gross Domestic Product',
             'IPO': 'Initial Public Offering',
             'Q1': 'First Quarter',
             'Q2': 'Second Quarter',
@@ -54,12 +107,78 @@ class MarketNormalizer:
             'Q4': 'Fourth Quarter',
         }
         
-        # Regex patterns
-        self.ticker_pattern = re.compile(r'\$[A-Z]{2,5}|[A-Z]{2,5}(?=/USD)|(?:BTC|ETH|SOL|DOGE|USDT|USDC|ADA|DOT|MATIC)')
-        self.price_pattern = re.compile(r'\$[\d,]+(?:\.\d{1,2})?|\d+(?:,\d{3})*(?:\.\d+)?%?')
-        self.date_pattern = re.compile(r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}|\d{1,2}/\d{1,2}/\d{2,4}|Q[1-4]\s+\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2},?\s+\d{4}', re.IGNORECASE)
-        self.comparator_pattern = re.compile(r'(?:above|below|over|under|more than|less than|at least|no more than|exceed|surpass|reach)\s+(?:\$?[\d,]+(?:\.\d+)?|[\d.]+%)', re.IGNORECASE)
-        
+        # Single alternation covering every abbreviation - one scan per text
+        # instead of one re.sub per abbreviation. Matching is case-insensitive,
+        # so keep an uppercased lookup for the replacement callback.
+        self._abbr_pattern = _compile_fast(
+            r'\b(' + '|'.join(re.escape(abbr) for abbr in self.abbreviations) + r')\b',
+            re.IGNORECASE
+        )
+        self._abbr_lookup = {abbr.upper(): full for abbr, full in self.abbreviations.items()}
+
+        # Precompiled patterns for clean_text (hot loop - one compile, reused per market)
+        self._ws_pattern = re.compile(r'\s+')
+        self._url_pattern = re.compile(r'https?://(?:www\.)?([^/\s]+)\S*')
+        self._special_char_pattern = re.compile(r'[^\w\s\$%\.,;:\-/()\'\"]+')
+        # Smart quotes -> ASCII quotes in a single C-level pass
+        self._quote_table = str.maketrans({
+            '“': '"', '”': '"',
+            '‘': "'", '’': "'",
+        })
+
+        # Regex patterns (raw sources kept so the combined pattern below can
+        # be assembled regardless of which engine compiled the parts)
+        ticker_src = r'\$[A-Z]{2,5}|[A-Z]{2,5}(?=/USD)|(?:BTC|ETH|SOL|DOGE|USDT|USDC|ADA|DOT|MATIC)'
+        price_src = r'\$[\d,]+(?:\.\d{1,2})?|\d+(?:,\d{3})*(?:\.\d+)?%?'
+        date_src = r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4}|\d{1,2}/\d{1,2}/\d{2,4}|Q[1-4]\s+\d{4}|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\.?\s+\d{1,2},?\s+\d{4}'
+        comparator_src = r'(?:above|below|over|under|more than|less than|at least|no more than|exceed|surpass|reach)\s+(?:\$?[\d,]+(?:\.\d+)?|[\d.]+%)'
+        self.ticker_pattern = re.compile(ticker_src)  # lookahead: stdlib only
+        self.price_pattern = _compile_fast(price_src)
+        self.date_pattern = _compile_fast(date_src, re.IGNORECASE)
+        self.comparator_pattern = _compile_fast(comparator_src, re.IGNORECASE)
+
+        # Combined entity pattern so extract_entities scans each text once
+        # instead of four times. Order matters: more specific alternatives
+        # (dates, comparators) come before the generic price pattern so
+        # overlapping spans resolve to the most specific entity. The date and
+        # comparator branches are case-insensitive via scoped (?i:...) while
+        # tickers stay case-sensitive. The ticker lookahead keeps this on the
+        # stdlib engine.
+        self._entities_pattern = re.compile(
+            r'(?P<ticker>' + ticker_src + r')'
+            r'|(?P<date>(?i:' + date_src + r'))'
+            r'|(?P<comparator>(?i:' + comparator_src + r'))'
+            r'|(?P<price>' + price_src + r')'
+        )
+
+        # Category keywords in priority order; the first category (by order
+        # here) with any keyword present wins, mirroring the old elif chain.
+        # All keywords are fused into one pattern so inference is a single
+        # scan of the text instead of one substring search per keyword.
+        self._category_keywords = [
+            ('politics', ['election', 'president', 'senate', 'congress', 'vote', 'candidate', 'political']),
+            ('crypto', ['btc', 'eth', 'crypto', 'bitcoin', 'ethereum', 'defi', 'nft', 'blockchain']),
+            ('economics', ['gdp', 'recession', 'inflation', 'rate', 'fed', 'economy', 'unemployment']),
+            ('sports', ['nba', 'nfl', 'mlb', 'uefa', 'world cup', 'championship', 'game', 'match', 'team']),
+            ('finance', ['stock', 'market', 'nasdaq', 's&p', 'dow', 'earnings', 'ipo']),
+            ('technology', ['ai', 'chatgpt', 'technology', 'tech', 'software', 'openai', 'google', 'meta']),
+            ('weather', ['weather', 'climate', 'temperature', 'hurricane', 'earthquake']),
+            ('entertainment', ['movie', 'oscar', 'emmy', 'grammy', 'box office', 'film']),
+        ]
+        self._category_by_keyword = {}
+        for priority, (cat, keywords) in enumerate(self._category_keywords):
+            for keyword in keywords:
+                self._category_by_keyword.setdefault(keyword, (priority, cat))
+        self._category_pattern = _compile_fast('|'.join(
+            re.escape(keyword)
+            for _, keywords in self._category_keywords
+            for keyword in keywords
+        ))
+
+        # Memo caches for the pure text transforms (see _TEXT_CACHE_SIZE)
+        self._clean_cache: Dict[str, str] = {}
+        self._expand_cache: Dict[str, str] = {}
+
         # Common boilerplate phrases to remove or minimize
         self.boilerplate_phrases = [
             'This market will resolve to',
@@ -69,61 +188,84 @@ class MarketNormalizer:
             'however a consensus of credible reporting may also be used',
             'Please refer to',
         ]
+        # All phrases fused into one pattern: one scan of the description
+        # instead of one str.replace per phrase
+        self._boilerplate_pattern = _compile_fast(
+            '|'.join(re.escape(phrase) for phrase in self.boilerplate_phrases)
+        )
+        self._resolution_split_pattern = _compile_fast(
+            r'The (?:primary )?resolution source', re.IGNORECASE
+        )
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         if not text:
             return ""
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
+
+        cached = self._clean_cache.get(text)
+        if cached is not None:
+            return cached
+
+        original = text
+
+        # Normalize quotes (single translate pass, no chained .replace)
+        text = text.translate(self._quote_table)
+
         # Remove URLs but keep the domain for context
-        text = re.sub(r'https?://(?:www\.)?([^/\s]+)[^\s]*', r'\1', text)
-        
-        # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"').replace(''', "'").replace(''', "'")
-        
+        text = self._url_pattern.sub(r'\1', text)
+
         # Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s\$%\.,;:\-/()\'\"]+', ' ', text)
-        
-        return text.strip()
+        text = self._special_char_pattern.sub(' ', text)
+
+        # Collapse whitespace once, at the end
+        text = self._ws_pattern.sub(' ', text).strip()
+
+        if len(self._clean_cache) >= _TEXT_CACHE_SIZE:
+            self._clean_cache.clear()
+        self._clean_cache[original] = text
+        return text
     
     def expand_abbreviations(self, text: str) -> str:
-        """Expand common abbreviations"""
-        expanded = text
-        for abbr, full in self.abbreviations.items():
-            # Word boundary matching to avoid partial replacements
-            pattern = r'\b' + re.escape(abbr) + r'\b'
-            expanded = re.sub(pattern, f"{abbr} ({full})", expanded, flags=re.IGNORECASE)
+        """Expand common abbreviations in a single pass"""
+        cached = self._expand_cache.get(text)
+        if cached is not None:
+            return cached
+
+        # Local binding keeps the per-match callback off the attribute lookup
+        lookup = self._abbr_lookup
+        expanded = self._abbr_pattern.sub(
+            lambda m: f"{m.group(1)} ({lookup[m.group(1).upper()]})",
+            text
+        )
+
+        if len(self._expand_cache) >= _TEXT_CACHE_SIZE:
+            self._expand_cache.clear()
+        self._expand_cache[text] = expanded
         return expanded
     
     def extract_entities(self, text: str) -> Dict[str, List[str]]:
-        """Extract entities from text using pattern matching"""
-        entities = {
-            'tickers': [],
-            'prices': [],
-            'dates': [],
-            'comparators': []
+        """Extract entities from text in a single pass over the combined pattern"""
+        # Dedup during insertion: one hash per match, no intermediate lists
+        buckets = {
+            'ticker': set(),
+            'price': set(),
+            'date': set(),
+            'comparator': set()
+        }
+
+        for match in self._entities_pattern.finditer(text):
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == 'ticker':
+                value = value.upper().replace('$', '')
+            buckets[kind].add(value)
+
+        return {
+            'tickers': list(buckets['ticker']),
+            'prices': list(buckets['price']),
+            'dates': list(buckets['date']),
+            'comparators': list(buckets['comparator']),
         }
-        
-        # Extract crypto/stock tickers
-        tickers = self.ticker_pattern.findall(text)
-        entities['tickers'] = list(set([t.upper().replace('$', '') for t in tickers]))
-        
-        # Extract prices and percentages
-        prices = self.price_pattern.findall(text)
-        entities['prices'] = list(set(prices))
-        
-        # Extract dates
-        dates = self.date_pattern.findall(text)
-        entities['dates'] = list(set(dates))
-        
-        # Extract comparative statements
-        comparators = self.comparator_pattern.findall(text)
-        entities['comparators'] = list(set(comparators))
-        
-        return entities
     
     def parse_end_date(self, end_date_iso: Optional[str], description: str) -> Optional[str]:
         """Parse and normalize end date"""
@@ -148,41 +290,30 @@ class MarketNormalizer:
         if category:
             return category.lower().strip()
         
-        # Infer from keywords
+        # Infer from keywords: one scan over the combined text, keeping the
+        # highest-priority category seen
         combined = (question + " " + description).lower()
-        
-        if any(word in combined for word in ['election', 'president', 'senate', 'congress', 'vote', 'candidate', 'political']):
-            return 'politics'
-        elif any(word in combined for word in ['btc', 'eth', 'crypto', 'bitcoin', 'ethereum', 'defi', 'nft', 'blockchain']):
-            return 'crypto'
-        elif any(word in combined for word in ['gdp', 'recession', 'inflation', 'rate', 'fed', 'economy', 'unemployment']):
-            return 'economics'
-        elif any(word in combined for word in ['nba', 'nfl', 'mlb', 'uefa', 'world cup', 'championship', 'game', 'match', 'team']):
-            return 'sports'
-        elif any(word in combined for word in ['stock', 'market', 'nasdaq', 's&p', 'dow', 'earnings', 'ipo']):
-            return 'finance'
-        elif any(word in combined for word in ['ai', 'chatgpt', 'technology', 'tech', 'software', 'openai', 'google', 'meta']):
-            return 'technology'
-        elif any(word in combined for word in ['weather', 'climate', 'temperature', 'hurricane', 'earthquake']):
-            return 'weather'
-        elif any(word in combined for word in ['movie', 'oscar', 'emmy', 'grammy', 'box office', 'film']):
-            return 'entertainment'
-        
-        return 'other'
+
+        by_keyword = self._category_by_keyword
+        best: Optional[tuple] = None
+        for match in self._category_pattern.finditer(combined):
+            hit = by_keyword[match.group(0)]
+            if best is None or hit[0] < best[0]:
+                best = hit
+                if best[0] == 0:
+                    break
+
+        return best[1] if best else 'other'
     
     def minimize_boilerplate(self, description: str) -> str:
         """Remove or minimize boilerplate text"""
-        minimized = description
-        
-        # Remove common boilerplate phrases
-        for phrase in self.boilerplate_phrases:
-            minimized = minimized.replace(phrase, '')
-        
+        # Remove common boilerplate phrases in one pass
+        minimized = self._boilerplate_pattern.sub('', description)
+
         # Remove resolution source details (usually at the end)
         if 'resolution source' in minimized.lower():
-            parts = re.split(r'The (?:primary )?resolution source', minimized, flags=re.IGNORECASE)
-            minimized = parts[0]
-        
+            minimized = self._resolution_split_pattern.split(minimized)[0]
+
         return minimized.strip()
     
     def create_searchable_text(self, market: Dict[str, Any]) -> str:
@@ -212,7 +343,33 @@ class MarketNormalizer:
         description = market.get('description', '')
         category = market.get('category')
         end_date_iso = market.get('end_date_iso')
-        
+
+        # Archived/malformed rows with no text at all: skip the whole regex
+        # pipeline and emit a thin record with just identifiers and flags
+        if not (question or description):
+            return {
+                'question': question,
+                'market_slug': market.get('market_slug'),
+                'condition_id': market.get('condition_id'),
+                'question_id': market.get('question_id'),
+                'question_normalized': '',
+                'description_normalized': '',
+                'searchable_text': '',
+                'entities': {'tickers': [], 'prices': [], 'dates': [], 'comparators': []},
+                'category': category.lower().strip() if category else 'other',
+                'end_date': self.parse_end_date(end_date_iso, ''),
+                'end_date_iso': end_date_iso,
+                'game_start_time': market.get('game_start_time'),
+                'active': market.get('active', False),
+                'closed': market.get('closed', False),
+                'archived': market.get('archived', False),
+                'accepting_orders': market.get('accepting_orders', False),
+                'icon': market.get('icon'),
+                'tokens': market.get('tokens', []),
+                'rewards': market.get('rewards'),
+                'has_liquidity_data': market.get('tokens') is not None and len(market.get('tokens', [])) > 0,
+            }
+
         # Create normalized representation
         normalized = {
             # Original identifiers
@@ -259,30 +416,36 @@ class MarketNormalizer:
     def normalize_markets_file(self, input_path: str, output_path: str) -> Dict[str, Any]:
         """Normalize all markets from input file and save to output file"""
         print(f"Loading markets from {input_path}...")
-        
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        markets = data.get('markets', [])
+
+        input_file = Path(input_path)
+        if input_file.suffix == '.jsonl':
+            # One market per line; run metadata lives in the sidecar file
+            with input_file.open('rb') as f:
+                markets = [orjson.loads(line) for line in f if line.strip()]
+            meta_path = input_file.with_suffix('.meta.json')
+            data = orjson.loads(meta_path.read_bytes()) if meta_path.exists() else {}
+        else:
+            # mmap lets orjson parse straight from kernel-paged bytes,
+            # avoiding a second in-memory copy of a multi-hundred-MB file
+            with input_file.open('rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = orjson.loads(memoryview(mm))
+            markets = data.get('markets', [])
         total = len(markets)
         
         print(f"Processing {total} markets...")
-        
-        normalized_markets = []
-        failed_count = 0
-        
-        for i, market in enumerate(markets):
-            try:
-                normalized = self.normalize_market(market)
-                normalized_markets.append(normalized)
-                
-                # Progress update
-                if (i + 1) % 1000 == 0:
-                    print(f"Processed {i + 1}/{total} markets...")
-            except Exception as e:
-                print(f"Error processing market {i}: {e}")
-                failed_count += 1
-        
+
+        # Normalization is pure CPU (regex-heavy) and per-market independent,
+        # so spread it across cores. Workers return None on failure.
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(_normalize_one, markets, chunksize=256)
+            normalized_markets = [
+                r for r in tqdm(results, total=total, desc="Normalizing", unit="market")
+                if r is not None
+            ]
+
+        failed_count = total - len(normalized_markets)
+
         # Create output structure
         output_data = {
             'timestamp': data.get('timestamp'),
@@ -295,9 +458,8 @@ class MarketNormalizer:
         
         print(f"Saving normalized markets to {output_path}...")
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        
+        Path(output_path).write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+
         print(f"✓ Successfully normalized {len(normalized_markets)} markets")
         print(f"✓ Failed: {failed_count}")
         print(f"✓ Output saved to {output_path}")
@@ -305,11 +467,31 @@ class MarketNormalizer:
         return output_data
 
 
+# Per-process normalizer for the worker pool, built lazily so each worker
+# compiles its regexes once rather than pickling the instance per task.
+_worker_normalizer: Optional[MarketNormalizer] = None
+
+
+def _normalize_one(market: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Normalize a single market in a worker process; None on failure"""
+    global _worker_normalizer
+    if _worker_normalizer is None:
+        _worker_normalizer = MarketNormalizer()
+    try:
+        return _worker_normalizer.normalize_market(market)
+    except Exception as e:
+        print(f"Error processing market {market.get('market_slug')}: {e}")
+        return None
+
+
 def main():
     """Main execution"""
     # Set up paths
     base_dir = Path(__file__).parent.parent
-    input_file = base_dir / 'data' / 'current_markets.json'
+    input_file = base_dir / 'data' / 'current_markets.jsonl'
+    if not input_file.exists():
+        # Older dumps were a single JSON blob
+        input_file = base_dir / 'data' / 'current_markets.json'
     output_file = base_dir / 'data' / 'normalized_markets.json'
     
     # Create normalizer
@@ -322,21 +504,20 @@ def main():
     print("\n=== Normalization Statistics ===")
     print(f"Total markets: {result['total_markets']}")
     
-    # Category distribution
-    categories = {}
+    # Category distribution and entity statistics in a single pass
+    categories: Counter = Counter()
+    total_with_tickers = total_with_dates = total_with_prices = 0
     for market in result['markets']:
-        cat = market['category']
-        categories[cat] = categories.get(cat, 0) + 1
-    
+        categories[market['category']] += 1
+        entities = market['entities']
+        total_with_tickers += bool(entities['tickers'])
+        total_with_dates += bool(entities['dates'])
+        total_with_prices += bool(entities['prices'])
+
     print("\nCategory distribution:")
-    for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+    for cat, count in categories.most_common():
         print(f"  {cat}: {count}")
-    
-    # Entity statistics
-    total_with_tickers = sum(1 for m in result['markets'] if m['entities']['tickers'])
-    total_with_dates = sum(1 for m in result['markets'] if m['entities']['dates'])
-    total_with_prices = sum(1 for m in result['markets'] if m['entities']['prices'])
-    
+
     print(f"\nMarkets with extracted entities:")
     print(f"  With tickers: {total_with_tickers}")
     print(f"  With dates: {total_with_dates}")
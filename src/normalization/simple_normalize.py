@@ -11,17 +11,78 @@ Key differences from full normalization:
 - More readable for debugging
 """
 
+import functools
 import json
+import os
 import re
 import hashlib
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+import orjson
+from tqdm import tqdm
+
+try:
+    # Optional accelerator: JIT-compile the token filter loop, which runs
+    # for every token of every market
+    from numba import njit, typed, types
+except ImportError:
+    njit = None
+
+try:
+    # Optional: batch entity extraction over whole worker chunks via
+    # pandas string methods instead of a Python-level loop per market
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    # Optional accelerator for the entity patterns: RE2 matches in
+    # guaranteed linear time, with no backtracking blowups on the
+    # number pattern's nested optional groups
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+
+def _compile(pattern: str, flags: int = 0):
+    """Prefer RE2 for a pattern, quietly keeping stdlib re otherwise"""
+    if _re2 is not None:
+        try:
+            return _re2.compile(pattern, flags)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+# ASCII characters outside [A-Za-z0-9_], deleted from tokens via
+# str.translate - a single C-level pass per token instead of a regex call
+_DELETE_CHARS = ''.join(
+    chr(i) for i in range(128) if not (chr(i).isalnum() or chr(i) == '_')
+)
+
 
 class SimpleMarketNormalizer:
     """Simplified normalizer focusing on essentials for semantic matching"""
-    
+
+    # Common stop words, built once at class definition instead of per
+    # extract_keywords call
+    _STOP_WORDS = frozenset({
+        'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i', 'it', 'for',
+        'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at', 'this', 'but', 'his', 'by',
+        'from', 'they', 'we', 'say', 'her', 'she', 'or', 'an', 'will', 'my', 'one', 'all',
+        'would', 'there', 'their', 'what', 'so', 'up', 'out', 'if', 'about', 'who', 'get',
+        'which', 'go', 'me', 'when', 'make', 'can', 'like', 'time', 'no', 'just', 'him',
+        'know', 'take', 'people', 'into', 'year', 'your', 'some', 'could', 'them', 'see',
+        'other', 'than', 'then', 'now', 'look', 'only', 'come', 'its', 'over', 'think',
+        'also', 'back', 'after', 'use', 'two', 'how', 'our', 'work', 'first', 'well',
+        'way', 'even', 'new', 'want', 'because', 'any', 'these', 'give', 'day', 'most', 'us',
+        'is', 'are', 'was', 'were', 'been', 'being', 'has', 'had', 'does', 'did', 'doing'
+    })
+
     def __init__(self):
         # Category keywords (simpler, more direct)
         self.category_keywords = {
@@ -40,81 +101,117 @@ class SimpleMarketNormalizer:
             'entertainment': ['movie', 'film', 'oscar', 'emmy', 'grammy', 'box office', 'album',
                              'actor', 'artist', 'tv show', 'netflix'],
         }
-    
+
+        # All category keywords fused into one alternation so categorize is
+        # a single scan of the text instead of ~80 substring searches.
+        # Longest keywords first so e.g. 'political' wins over 'politic'.
+        self._CATEGORY_BY_KEYWORD = {}
+        for cat, keywords in self.category_keywords.items():
+            for keyword in keywords:
+                self._CATEGORY_BY_KEYWORD.setdefault(keyword, cat)
+        self._RE_CATEGORY = re.compile('|'.join(
+            re.escape(keyword)
+            for keyword in sorted(self._CATEGORY_BY_KEYWORD, key=len, reverse=True)
+        ))
+
+        # Every pattern compiled once here; these run per market (and the
+        # non-word strip per token), so skipping the re-cache lookup and
+        # argument parsing on each call is a measurable win
+        self._RE_WS = re.compile(r'\s+')
+        # URL removal and disallowed-character stripping fused into one
+        # alternation so clean_text touches each character once
+        self._RE_CLEAN = re.compile(r'https?://\S+|[^\w\s\$%\.\,\-]+')
+        self._RE_NONWORD = re.compile(r'[^\w]')
+        # Pattern sources are kept alongside the compiled forms; the batch
+        # path hands the strings to pandas .str.findall
+        self._TICKER_SRC = r'\b(?:BTC|ETH|SOL|USDT|USDC|DOGE|ADA|DOT|MATIC|AVAX|LINK|UNI)\b'
+        self._NUMBER_SRC = r'\$\d+[,\d]*(?:\.\d+)?[kKmMbB]?|\d+(?:\.\d+)?%'
+        self._YEAR_SRC = r'\b20\d{2}\b'
+        self._RE_NUMBER = _compile(self._NUMBER_SRC)
+        self._RE_YEAR = _compile(self._YEAR_SRC)
+
+        # Ticker detection in the scalar path is a set intersection over
+        # the text's tokens - O(1) per token versus running the alternation
+        self._TICKERS = frozenset({
+            'BTC', 'ETH', 'SOL', 'USDT', 'USDC', 'DOGE',
+            'ADA', 'DOT', 'MATIC', 'AVAX', 'LINK', 'UNI',
+        })
+        # Tokens for the set test are maximal word-character runs, so
+        # whole-token membership matches _TICKER_SRC's \b boundaries
+        self._RE_TOKEN_SPLIT = re.compile(r'\W+')
+        # Cheap "could anything match?" probe: most markets contain no
+        # ticker, price, or year, so one search usually replaces three
+        # findall scans
+        self._RE_ENTITY_ANY = _compile(
+            r'(?i:\b(?:BTC|ETH|SOL|USDT|USDC|DOGE|ADA|DOT|MATIC|AVAX|LINK|UNI)\b)'
+            r'|\$\d|\d(?:\.\d+)?%|\b20\d{2}\b'
+        )
+        self._RE_SLUG_STRIP = re.compile(r'[^\w\s-]')
+        self._RE_SLUG_DASH = re.compile(r'[-\s]+')
+
+        # Deletion table for per-token cleaning (see _DELETE_CHARS)
+        self._KEEP_TABLE = str.maketrans('', '', _DELETE_CHARS)
+
+        # Dumps repeat questions across snapshots, so the deterministic
+        # text work is memoized per (question, description). Bound to the
+        # instance so the cache dies with the normalizer.
+        self._text_pipeline = functools.lru_cache(maxsize=100_000)(self._text_pipeline_uncached)
+
     def clean_text(self, text: str) -> str:
         """Basic text cleaning - just the essentials"""
         if not text:
             return ""
         
-        # Lowercase and remove extra whitespace
-        text = text.lower().strip()
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove URLs completely
-        text = re.sub(r'https?://\S+', '', text)
-        
-        # Keep only basic characters
-        text = re.sub(r'[^\w\s\$%\.\,\-]', ' ', text)
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        # Lowercase once, drop URLs and disallowed characters in one pass,
+        # then collapse whitespace once at the end
+        text = self._RE_CLEAN.sub(' ', text.lower())
+        return self._RE_WS.sub(' ', text).strip()
     
-    def extract_keywords(self, text: str) -> List[str]:
-        """Extract meaningful keywords from text"""
-        # Remove common stop words
-        stop_words = {
-            'the', 'be', 'to', 'of', 'and', 'a', 'in', 'that', 'have', 'i', 'it', 'for',
-            'not', 'on', 'with', 'he', 'as', 'you', 'do', 'at', 'this', 'but', 'his', 'by',
-            'from', 'they', 'we', 'say', 'her', 'she', 'or', 'an', 'will', 'my', 'one', 'all',
-            'would', 'there', 'their', 'what', 'so', 'up', 'out', 'if', 'about', 'who', 'get',
-            'which', 'go', 'me', 'when', 'make', 'can', 'like', 'time', 'no', 'just', 'him',
-            'know', 'take', 'people', 'into', 'year', 'your', 'some', 'could', 'them', 'see',
-            'other', 'than', 'then', 'now', 'look', 'only', 'come', 'its', 'over', 'think',
-            'also', 'back', 'after', 'use', 'two', 'how', 'our', 'work', 'first', 'well',
-            'way', 'even', 'new', 'want', 'because', 'any', 'these', 'give', 'day', 'most', 'us',
-            'is', 'are', 'was', 'were', 'been', 'being', 'has', 'had', 'does', 'did', 'doing'
-        }
-        
-        # Tokenize and filter
-        words = text.lower().split()
-        keywords = []
-        
-        for word in words:
-            # Clean word
-            word = re.sub(r'[^\w]', '', word)
-            
-            # Skip if too short, is stop word, or is number
-            if len(word) < 3 or word in stop_words or word.isdigit():
-                continue
-            
-            keywords.append(word)
-        
-        # Remove duplicates while preserving order
-        seen: Set[str] = set()
-        unique_keywords = []
-        for kw in keywords:
-            if kw not in seen:
-                seen.add(kw)
-                unique_keywords.append(kw)
-        
-        # Limit to top 20 keywords
-        return unique_keywords[:20]
+    def extract_keywords(self, tokens: List[str]) -> List[str]:
+        """Extract meaningful keywords from pre-lowercased tokens"""
+        # Clean tokens first (str.translate is not JIT-able), then hand the
+        # filter+dedup loop to the compiled kernel when numba is available
+        cleaned = []
+        append = cleaned.append
+        for word in tokens:
+            # Clean word; translate handles the common ASCII case without a
+            # regex call, non-ASCII tokens fall back to the pattern
+            if word.isascii():
+                append(word.translate(self._KEEP_TABLE))
+            else:
+                append(self._RE_NONWORD.sub('', word))
+
+        if _jit_filter_tokens is not None:
+            typed_tokens = typed.List.empty_list(types.unicode_type)
+            for word in cleaned:
+                typed_tokens.append(word)
+            return list(_jit_filter_tokens(typed_tokens, _JIT_STOP_WORDS))
+
+        return _filter_tokens(cleaned, self._STOP_WORDS)
     
-    def categorize(self, question: str, description: str) -> str:
-        """Simple category inference based on keyword matching"""
-        combined = (question + " " + description).lower()
-        
-        # Count keyword matches for each category
-        scores = {}
+    def categorize(self, combined_lower: str) -> str:
+        """Simple category inference based on keyword matching
+
+        Takes the already-lowercased question+description so callers can
+        share one lowered copy across the extractors.
+        """
+        # The fused scan only narrows the field: it consumes the longest
+        # match at each position, so nested keywords ('eth' in 'ethereum',
+        # 'coin' in 'bitcoin') would be undercounted if scored directly.
+        # Candidate categories are then scored by independent substring
+        # presence, exactly like the original per-keyword loop.
+        matched = self._RE_CATEGORY.findall(combined_lower)
+        if not matched:
+            return 'other'
+
+        candidates = {self._CATEGORY_BY_KEYWORD[keyword] for keyword in matched}
+        scores: Dict[str, int] = {}
         for category, keywords in self.category_keywords.items():
-            score = sum(1 for keyword in keywords if keyword in combined)
-            if score > 0:
-                scores[category] = score
-        
-        # Return category with highest score, or 'other'
-        if scores:
-            return max(scores, key=scores.get)
-        return 'other'
+            if category in candidates:
+                scores[category] = sum(1 for keyword in keywords if keyword in combined_lower)
+
+        # Ties resolve in category_keywords declaration order, as before
+        return max(scores, key=scores.get)
     
     def extract_key_entities(self, text: str) -> Dict[str, List[str]]:
         """Extract only the most important entities - lightweight version"""
@@ -123,30 +220,70 @@ class SimpleMarketNormalizer:
             'numbers': [],
             'dates': []
         }
-        
-        # Crypto/stock tickers (simple patterns)
-        ticker_pattern = r'\b(?:BTC|ETH|SOL|USDT|USDC|DOGE|ADA|DOT|MATIC|AVAX|LINK|UNI)\b'
-        entities['tickers'] = list(set(re.findall(ticker_pattern, text.upper())))
-        
+
+        # Bail out before any findall when nothing can match
+        if not self._RE_ENTITY_ANY.search(text):
+            return entities
+
+        # Crypto/stock tickers via token-set intersection. _TICKER_SRC is
+        # the authoritative definition (the pandas batch path runs it
+        # directly); splitting on \W+ yields exactly the tokens its \b
+        # boundaries delimit, so both paths agree on e.g. "ETH/USD".
+        upper_tokens = {token.upper() for token in self._RE_TOKEN_SPLIT.split(text)}
+        entities['tickers'] = list(upper_tokens & self._TICKERS)
+
         # Important numbers (prices, percentages)
-        number_pattern = r'\$\d+[,\d]*(?:\.\d+)?[kKmMbB]?|\d+(?:\.\d+)?%'
-        entities['numbers'] = list(set(re.findall(number_pattern, text)))[:5]  # Top 5
-        
+        entities['numbers'] = list(set(self._RE_NUMBER.findall(text)))[:5]  # Top 5
+
         # Year mentions (simple)
-        year_pattern = r'\b20\d{2}\b'
-        entities['dates'] = list(set(re.findall(year_pattern, text)))[:3]  # Top 3
+        entities['dates'] = list(set(self._RE_YEAR.findall(text)))[:3]  # Top 3
         
         return entities
-    
+
+    def _text_pipeline_uncached(self, question: str, description: str) -> tuple:
+        """Categorize and extract keywords for one question/description pair
+
+        Backs the _text_pipeline LRU cache; entities are excluded because
+        the chunk path precomputes them vectorized before this runs.
+        """
+        combined_lower = (question + " " + description).lower()
+        return self.categorize(combined_lower), self.extract_keywords(combined_lower.split())
+
+    def extract_key_entities_batch(self, texts: List[str]) -> List[Dict[str, List[str]]]:
+        """Vectorized extract_key_entities over a chunk of combined texts"""
+        if pd is None:
+            return [self.extract_key_entities(text) for text in texts]
+
+        series = pd.Series(texts, dtype=object)
+        tickers = series.str.findall(self._TICKER_SRC, flags=re.IGNORECASE)
+        numbers = series.str.findall(self._NUMBER_SRC)
+        years = series.str.findall(self._YEAR_SRC)
+        return [
+            {
+                'tickers': list({t.upper() for t in found_t}),
+                'numbers': list(set(found_n))[:5],
+                'dates': list(set(found_y))[:3],
+            }
+            for found_t, found_n, found_y in zip(tickers, numbers, years)
+        ]
+
     def extract_simple_date(self, end_date_iso: Optional[str]) -> Optional[str]:
         """Extract simple date format"""
         if not end_date_iso:
             return None
-        
+
+        # API dates virtually always start 'YYYY-MM-DD', which is exactly
+        # what we return - slice it out positionally and skip the full
+        # fromisoformat parse + strftime round trip
+        head = end_date_iso[:10]
+        if (len(head) == 10 and head[4] == '-' and head[7] == '-'
+                and head[:4].isdigit() and head[5:7].isdigit() and head[8:].isdigit()):
+            return head
+
         try:
             dt = datetime.fromisoformat(end_date_iso.replace('Z', '+00:00'))
             return dt.strftime('%Y-%m-%d')
-        except:
+        except ValueError:
             return None
     
     def create_search_text(self, question: str, description: str, category: str) -> str:
@@ -163,34 +300,46 @@ class SimpleMarketNormalizer:
     
     def generate_id_from_question(self, question: str) -> str:
         """Generate a stable ID from question text"""
-        # Create a hash of the question for a stable identifier
-        return hashlib.md5(question.encode('utf-8')).hexdigest()[:16]
+        # blake2b is considerably faster than md5 on short strings and we
+        # only need stable identity, not cryptographic strength; an 8-byte
+        # digest gives the same 16 hex chars as the old truncated md5
+        return hashlib.blake2b(question.encode('utf-8'), digest_size=8).hexdigest()
     
     def create_slug_from_question(self, question: str) -> str:
         """Create a URL-friendly slug from question"""
         # Lowercase and remove special characters
         slug = question.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
+        slug = self._RE_SLUG_STRIP.sub('', slug)
+        slug = self._RE_SLUG_DASH.sub('-', slug)
         # Limit length
         slug = slug[:60]
         return slug.strip('-')
     
-    def normalize_market(self, market: Dict[str, Any]) -> Dict[str, Any]:
-        """Create simple normalized market record"""
+    def normalize_market(self, market: Dict[str, Any],
+                         entities: Optional[Dict[str, List[str]]] = None) -> Dict[str, Any]:
+        """Create simple normalized market record
+
+        entities may be precomputed (see extract_key_entities_batch) when
+        normalizing a whole chunk; otherwise they are extracted here.
+        """
+        # Unpack the canonical market shape in one place; nothing below
+        # touches the input dict again
         question = market.get('question', '')
         description = market.get('description', '')
-        
-        # Basic fields
-        category = self.categorize(question, description)
-        keywords = self.extract_keywords(question + " " + description)
-        entities = self.extract_key_entities(question + " " + description)
-        
-        # Extract identifiers - try multiple fields
         condition_id = market.get('condition_id')
         question_id = market.get('question_id')
         market_slug = market.get('market_slug')
-        
+        end_date_iso = market.get('end_date_iso')
+        active = market.get('active', False)
+        closed = market.get('closed', False)
+        icon = market.get('icon')
+
+        # Basic fields; duplicate questions hit the LRU and skip the
+        # categorize and keyword passes entirely
+        category, keywords = self._text_pipeline(question, description)
+        if entities is None:
+            entities = self.extract_key_entities(question + " " + description)
+
         # Generate fallback identifiers if API didn't provide them
         if not condition_id and not question_id and not market_slug:
             # Use question hash as stable ID
@@ -220,72 +369,132 @@ class SimpleMarketNormalizer:
             'years': entities['dates'],
             
             # Metadata
-            'end_date': self.extract_simple_date(market.get('end_date_iso')),
-            'active': market.get('active', False),
-            'closed': market.get('closed', False),
-            
+            'end_date': self.extract_simple_date(end_date_iso),
+            'active': active,
+            'closed': closed,
+
             # Optional
-            'icon': market.get('icon'),
+            'icon': icon,
         }
     
     def normalize_markets_file(self, input_path: str, output_path: str) -> Dict[str, Any]:
         """Normalize all markets - simple version"""
         print(f"Loading markets from {input_path}...")
-        
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        markets = data.get('markets', [])
-        total = len(markets)
-        
-        print(f"Processing {total} markets (simple normalization)...")
-        
-        normalized_markets = []
-        failed_count = 0
+
+        input_file = Path(input_path)
+        if input_file.suffix == '.jsonl':
+            # Stream one market per line instead of materializing the dump;
+            # run metadata lives in the sidecar file written by the fetcher
+            meta_path = input_file.with_suffix('.meta.json')
+            meta = orjson.loads(meta_path.read_bytes()) if meta_path.exists() else {}
+            markets = _iter_jsonl(input_file)
+        else:
+            meta = orjson.loads(input_file.read_bytes())
+            markets = meta.get('markets', [])
+
+        print("Processing markets (simple normalization)...")
+
+        # Per-market normalization is pure CPU and independent, so fan it
+        # out across cores; duplicate-ID assignment is order-dependent and
+        # stays on the main process. Each record is appended to the output
+        # file as it arrives, so no full serialization buffer is built.
+        #
+        # Only the columns the stats pass needs are retained, as parallel
+        # flat lists (plus one sample record) - holding every ~15-key dict
+        # for the whole dump costs far more memory and cache locality.
+        ids: List[str] = []
+        categories: List[str] = []
+        keyword_lists: List[List[str]] = []
+        ticker_lists: List[List[str]] = []
+        number_lists: List[List[str]] = []
+        year_lists: List[List[str]] = []
+        sample = None
         seen_ids = {}  # Track IDs and add index for duplicates
-        
-        for i, market in enumerate(markets):
-            try:
-                normalized = self.normalize_market(market)
-                
-                # Handle duplicate IDs by adding an index
-                original_id = normalized['id']
-                if original_id in seen_ids:
-                    seen_ids[original_id] += 1
-                    # Append index to make unique
-                    normalized['id'] = f"{original_id}_{seen_ids[original_id]}"
-                else:
-                    seen_ids[original_id] = 0
-                
-                normalized_markets.append(normalized)
-                
-                # Progress update
-                if (i + 1) % 1000 == 0:
-                    print(f"Processed {i + 1}/{total} markets...")
-            except Exception as e:
-                print(f"Error processing market {i}: {e}")
-                failed_count += 1
-        
-        # Create compact output
-        output_data = {
-            'timestamp': data.get('timestamp'),
-            'normalized_at': datetime.now().isoformat(),
-            'normalization_type': 'simple',
-            'total_markets': len(normalized_markets),
-            'failed_count': failed_count,
-            'markets': normalized_markets
+        processed = 0
+        first = True
+
+        # One progress tick per chunk keeps the bar off the per-market
+        # hot path; counts are in markets via the per-batch update
+        progress = tqdm(desc="Normalizing", unit="market")
+
+        # Executor.map would submit every chunk eagerly, draining the
+        # input generator and pickling the whole dump into queued tasks
+        # before the first result lands. A bounded window (submit K,
+        # collect one, submit the next) keeps input-side memory at
+        # O(window) chunks while still keeping every worker busy.
+        chunks = _iter_chunks(markets, 1000)
+        window = 2 * (os.cpu_count() or 1)
+        pending = deque()
+
+        with ProcessPoolExecutor() as executor, Path(output_path).open('wb') as f:
+            f.write(b'{"markets":[')
+            for chunk in chunks:
+                pending.append(executor.submit(_normalize_chunk, chunk))
+                if len(pending) == window:
+                    break
+            while pending:
+                batch = pending.popleft().result()
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.append(executor.submit(_normalize_chunk, next_chunk))
+                progress.update(len(batch))
+                for normalized in batch:
+                    processed += 1
+                    if normalized is None:
+                        continue
+
+                    # Handle duplicate IDs by adding an index
+                    original_id = normalized['id']
+                    if original_id in seen_ids:
+                        seen_ids[original_id] += 1
+                        # Append index to make unique
+                        normalized['id'] = f"{original_id}_{seen_ids[original_id]}"
+                    else:
+                        seen_ids[original_id] = 0
+
+                    if first:
+                        first = False
+                    else:
+                        f.write(b',')
+                    f.write(orjson.dumps(normalized))
+
+                    ids.append(normalized['id'])
+                    categories.append(normalized['category'])
+                    keyword_lists.append(normalized['keywords'])
+                    ticker_lists.append(normalized['tickers'])
+                    number_lists.append(normalized['numbers'])
+                    year_lists.append(normalized['years'])
+                    if sample is None:
+                        sample = normalized
+
+            progress.close()
+            failed_count = processed - len(ids)
+
+            # Close the array and splice in the run metadata
+            footer = {
+                'timestamp': meta.get('timestamp'),
+                'normalized_at': datetime.now().isoformat(),
+                'normalization_type': 'simple',
+                'total_markets': len(ids),
+                'failed_count': failed_count,
+            }
+            f.write(b'],' + orjson.dumps(footer, option=orjson.OPT_NON_STR_KEYS)[1:])
+
+        output_data = dict(footer)
+        output_data['columns'] = {
+            'ids': ids,
+            'categories': categories,
+            'keywords': keyword_lists,
+            'tickers': ticker_lists,
+            'numbers': number_lists,
+            'years': year_lists,
         }
-        
-        print(f"Saving normalized markets to {output_path}...")
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
-        
+        output_data['sample'] = sample
+
         # Calculate file sizes
-        import os
         output_size_mb = os.path.getsize(output_path) / (1024 * 1024)
         
-        print(f"\n✓ Successfully normalized {len(normalized_markets)} markets")
+        print(f"\n✓ Successfully normalized {len(ids)} markets")
         print(f"✓ Failed: {failed_count}")
         print(f"✓ Output size: {output_size_mb:.1f} MB")
         print(f"✓ Output saved to {output_path}")
@@ -293,11 +502,117 @@ class SimpleMarketNormalizer:
         return output_data
 
 
+def _iter_jsonl(path: Path):
+    """Yield one parsed record per JSONL line without loading the file"""
+    with path.open('rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def _iter_chunks(iterable, size: int):
+    """Yield lists of up to `size` items from any iterable"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _filter_tokens(tokens: List[str], stop_words) -> List[str]:
+    """Filter and dedup cleaned tokens; pure-Python fallback for the JIT path"""
+    seen = set()
+    keywords = []
+    for word in tokens:
+        # Skip if too short, is stop word, or is number
+        if len(word) < 3 or word in stop_words or word.isdigit():
+            continue
+        if word not in seen:
+            seen.add(word)
+            keywords.append(word)
+            if len(keywords) == 20:
+                break
+    return keywords
+
+
+_jit_filter_tokens = None
+_JIT_STOP_WORDS = None
+
+if njit is not None:
+    try:
+        @njit(cache=True)
+        def _jit_filter_tokens(tokens, stop_words):
+            # Mirrors _filter_tokens; typed.Dict stands in for a set since
+            # numba has no typed set of strings
+            seen = typed.Dict.empty(types.unicode_type, types.uint8)
+            keywords = typed.List.empty_list(types.unicode_type)
+            for word in tokens:
+                if len(word) < 3 or word in stop_words or word.isdigit():
+                    continue
+                if word not in seen:
+                    seen[word] = 1
+                    keywords.append(word)
+                    if len(keywords) == 20:
+                        break
+            return keywords
+
+        _JIT_STOP_WORDS = typed.Dict.empty(types.unicode_type, types.uint8)
+        for _word in SimpleMarketNormalizer._STOP_WORDS:
+            _JIT_STOP_WORDS[_word] = 1
+
+        # Warm the JIT once so the compile cost lands at import time
+        # instead of on the first market in the hot loop
+        _warm = typed.List.empty_list(types.unicode_type)
+        _warm.append('warmup')
+        _jit_filter_tokens(_warm, _JIT_STOP_WORDS)
+    except Exception:
+        # Any compile/typing failure degrades to the pure-Python filter
+        _jit_filter_tokens = None
+        _JIT_STOP_WORDS = None
+
+
+# Per-process normalizer for the worker pool, built lazily so each worker
+# compiles its patterns once rather than pickling the instance per task
+_worker_normalizer: Optional[SimpleMarketNormalizer] = None
+
+
+def _normalize_chunk(chunk: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+    """Normalize a chunk of markets in a worker process; None on failure
+
+    Entity extraction runs vectorized over the whole chunk up front, then
+    each market is normalized with its precomputed entities.
+    """
+    global _worker_normalizer
+    if _worker_normalizer is None:
+        _worker_normalizer = SimpleMarketNormalizer()
+
+    texts = [
+        market.get('question', '') + " " + market.get('description', '')
+        for market in chunk
+    ]
+    entities = _worker_normalizer.extract_key_entities_batch(texts)
+
+    results = []
+    for market, market_entities in zip(chunk, entities):
+        try:
+            results.append(_worker_normalizer.normalize_market(market, entities=market_entities))
+        except Exception as e:
+            print(f"Error processing market {market.get('market_slug')}: {e}")
+            results.append(None)
+    return results
+
+
 def main():
     """Main execution"""
     # Set up paths
     base_dir = Path(__file__).parent.parent
-    input_file = base_dir / 'data' / 'current_markets.json'
+    input_file = base_dir / 'data' / 'current_markets.jsonl'
+    if not input_file.exists():
+        # Older dumps were a single JSON blob
+        input_file = base_dir / 'data' / 'current_markets.json'
     output_file = base_dir / 'data' / 'simple_normalized_markets.json'
     
     # Create normalizer
@@ -310,38 +625,37 @@ def main():
     print("\n=== Simple Normalization Statistics ===")
     print(f"Total markets: {result['total_markets']}")
     
-    # Category distribution
-    categories = {}
-    for market in result['markets']:
-        cat = market['category']
-        categories[cat] = categories.get(cat, 0) + 1
-    
+    # All stats accumulate in a single fused pass over the per-field
+    # columns collected during the run, instead of one pass per figure
+    columns = result['columns']
+    cat_counts = Counter(columns['categories'])
+    total_keywords = 0
+    with_tickers = with_numbers = with_years = 0
+    for keywords, tickers, numbers, years in zip(
+            columns['keywords'], columns['tickers'],
+            columns['numbers'], columns['years']):
+        total_keywords += len(keywords)
+        with_tickers += bool(tickers)
+        with_numbers += bool(numbers)
+        with_years += bool(years)
+
     print("\nCategory distribution:")
-    for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+    for cat, count in cat_counts.most_common():
         print(f"  {cat}: {count}")
-    
-    # Keyword stats
-    total_keywords = sum(len(m['keywords']) for m in result['markets'])
-    avg_keywords = total_keywords / len(result['markets']) if result['markets'] else 0
-    
+
+    avg_keywords = total_keywords / result['total_markets'] if result['total_markets'] else 0
     print(f"\nKeyword statistics:")
     print(f"  Average keywords per market: {avg_keywords:.1f}")
-    
-    # Entity stats
-    with_tickers = sum(1 for m in result['markets'] if m['tickers'])
-    with_numbers = sum(1 for m in result['markets'] if m['numbers'])
-    with_years = sum(1 for m in result['markets'] if m['years'])
-    
+
     print(f"\nEntity extraction:")
     print(f"  Markets with tickers: {with_tickers}")
     print(f"  Markets with numbers: {with_numbers}")
     print(f"  Markets with years: {with_years}")
-    
+
     # Sample output
     print("\n=== Sample Normalized Market ===")
-    if result['markets']:
-        sample = result['markets'][0]
-        print(json.dumps(sample, indent=2))
+    if result['sample'] is not None:
+        print(json.dumps(result['sample'], indent=2))
 
 
 if __name__ == '__main__':